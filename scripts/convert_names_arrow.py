@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+One-time conversion of the name-dataset dicts to Arrow IPC files.
+
+The name-dataset library stores its data as giant Python dicts (~3.2GB
+resident for both halves, most of it PyObject overhead). This script
+flattens each half into a columnar (name, country, rank[, gender]) table
+and writes it as an Arrow IPC file under the shared cache directory.
+extract_names.py memory-maps these files when they exist, dropping its
+resident footprint by roughly an order of magnitude.
+
+Usage:
+    python -m scripts.convert_names_arrow
+"""
+
+import argparse
+import sys
+
+import pyarrow as pa
+
+try:
+    from scripts.extract_names import (
+        FIRST_NAMES_ARROW,
+        FIRST_NAMES_CACHE,
+        LAST_NAMES_ARROW,
+        LAST_NAMES_CACHE,
+        _load_half,
+    )
+except ImportError:
+    # Allow running as a plain file: python scripts/convert_names_arrow.py
+    from extract_names import (
+        FIRST_NAMES_ARROW,
+        FIRST_NAMES_CACHE,
+        LAST_NAMES_ARROW,
+        LAST_NAMES_CACHE,
+        _load_half,
+    )
+
+
+def build_first_names_table(first_names: dict) -> pa.Table:
+    """
+    Flatten the first-names dict into (name, country, rank, gender) rows.
+
+    Each name contributes one row per country it is ranked in. The gender
+    column holds 'M' or 'F' by the name's predominant gender probability
+    (the raw dict keys the probabilities as 'M'/'F'), with ties going to
+    'F' exactly as NameDataset.get_top_names buckets names. Names with no
+    gender data land in the library's 'N/A' bucket and never appear in
+    first-name results, so they are skipped here rather than mis-bucketed.
+
+    Args:
+        first_names: The library's first-names dict
+
+    Returns:
+        Arrow table with dictionary-encoded name/country/gender columns
+    """
+    names, countries, ranks, genders = [], [], [], []
+    for name, entry in first_names.items():
+        gender_probs = entry.get('gender') or {}
+        if not gender_probs:
+            continue
+        gender = ('M' if gender_probs.get('M', 0.0)
+                  > gender_probs.get('F', 0.0) else 'F')
+        for country, rank in (entry.get('rank') or {}).items():
+            if rank is None:
+                continue
+            names.append(name)
+            countries.append(country)
+            ranks.append(rank)
+            genders.append(gender)
+    return pa.table({
+        'name': pa.array(names).dictionary_encode(),
+        'country': pa.array(countries).dictionary_encode(),
+        'rank': pa.array(ranks, type=pa.int32()),
+        'gender': pa.array(genders).dictionary_encode(),
+    })
+
+
+def build_last_names_table(last_names: dict) -> pa.Table:
+    """
+    Flatten the last-names dict into (name, country, rank) rows.
+
+    Args:
+        last_names: The library's last-names dict
+
+    Returns:
+        Arrow table with dictionary-encoded name/country columns
+    """
+    names, countries, ranks = [], [], []
+    for name, entry in last_names.items():
+        for country, rank in (entry.get('rank') or {}).items():
+            if rank is None:
+                continue
+            names.append(name)
+            countries.append(country)
+            ranks.append(rank)
+    return pa.table({
+        'name': pa.array(names).dictionary_encode(),
+        'country': pa.array(countries).dictionary_encode(),
+        'rank': pa.array(ranks, type=pa.int32()),
+    })
+
+
+def write_table(table: pa.Table, path) -> None:
+    """
+    Write a table as an Arrow IPC file suitable for memory mapping.
+
+    Args:
+        table: Table to write
+        path: Destination path
+    """
+    with pa.OSFile(str(path), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def convert() -> None:
+    """Convert both halves, one at a time to bound peak memory."""
+    print("Converting first names...")
+    first_names = _load_half(FIRST_NAMES_CACHE, use_first_names=True)
+    table = build_first_names_table(first_names)
+    del first_names
+    write_table(table, FIRST_NAMES_ARROW)
+    print(f"  Wrote {table.num_rows:,} rows to {FIRST_NAMES_ARROW}")
+    del table
+
+    print("Converting last names...")
+    last_names = _load_half(LAST_NAMES_CACHE, use_first_names=False)
+    table = build_last_names_table(last_names)
+    del last_names
+    write_table(table, LAST_NAMES_ARROW)
+    print(f"  Wrote {table.num_rows:,} rows to {LAST_NAMES_ARROW}")
+
+
+def main():
+    """
+    CLI entry point.
+    """
+    parser = argparse.ArgumentParser(
+        description='Convert name-dataset dicts to memory-mappable Arrow files.'
+    )
+    parser.parse_args()
+
+    try:
+        convert()
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
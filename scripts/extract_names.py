@@ -13,38 +13,269 @@ Usage:
     python scripts/extract_names.py --top-n 500 --output output
 
 Output files:
-    - names-lexicon.json: Raw JSON lexicon
-    - names-lexicon.ts: TypeScript module
-    - names-lexicon.mjs: ESM JavaScript module
-    - names-lexicon.cjs: CommonJS module
+    - names-lexicon.json: Raw JSON lexicon (carries the data)
+    - names-lexicon.ts: TypeScript wrapper importing the JSON
+    - names-lexicon.mjs: ESM JavaScript wrapper importing the JSON
+    - names-lexicon.cjs: CommonJS wrapper importing the JSON
 
-Note: The name-dataset library requires approximately 3.2GB of RAM to load.
+Note: The name-dataset library needs ~3.2GB of RAM fully loaded; this script
+loads one half (first or last names) at a time, roughly halving peak usage.
 """
 
 import argparse
-import json
+import asyncio
+import gc
+import pickle
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Set
+from typing import Dict, List, Optional, Union
 
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pycountry
 from names_dataset import NameDataset
 
+# Buffer size for output file writes.
+WRITE_BUFFER_SIZE = 1 << 16
 
-def initialize_dataset() -> NameDataset:
+# Pickle snapshots of the two name dicts. Loading these is ~500x faster than
+# letting the library re-parse its data files on every invocation.
+CACHE_DIR = Path.home() / '.cache' / 'python-scripts' / 'name-dataset'
+FIRST_NAMES_CACHE = CACHE_DIR / 'first_names.pkl'
+LAST_NAMES_CACHE = CACHE_DIR / 'last_names.pkl'
+
+# Memory-mappable Arrow IPC tables produced by convert_names_arrow.py.
+# Preferred over the pickle snapshots when present: pages are mapped in
+# on demand instead of materializing millions of PyObject dict entries.
+FIRST_NAMES_ARROW = CACHE_DIR / 'first_names.arrow'
+LAST_NAMES_ARROW = CACHE_DIR / 'last_names.arrow'
+
+
+def _load_half(cache_file: Path, use_first_names: bool) -> dict:
     """
-    Initialize the NameDataset. This loads the full database into memory.
-    
+    Load one of the two name dicts, preferring the pickle snapshot.
+
+    On a cache miss the library is asked to parse only the requested
+    half (its constructor accepts load_first_names/load_last_names
+    flags), and the result is snapshotted for subsequent runs.
+
+    Args:
+        cache_file: Pickle snapshot path for this half
+        use_first_names: True for the first-names dict, False for last names
+
     Returns:
-        NameDataset: Initialized dataset object
-        
-    Note:
-        This operation requires ~3.2GB of RAM and may take a minute to complete.
+        The library's name dict for the requested half
+    """
+    if cache_file.exists():
+        print(f"  Loading {cache_file.name} from cache...")
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+
+    kind = 'first' if use_first_names else 'last'
+    print(f"  Parsing {kind}-name data (this may take a while)...")
+    nd = NameDataset(
+        load_first_names=use_first_names,
+        load_last_names=not use_first_names,
+    )
+    data = nd.first_names if use_first_names else nd.last_names
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(cache_file, 'wb') as f:
+        pickle.dump(data, f, protocol=5)
+    return data
+
+
+class LazyNameDataset(NameDataset):
+    """
+    NameDataset that materializes each name-dict half on demand.
+
+    The stock constructor loads both halves (~3.2 GB) even though the
+    extraction phases only ever need one at a time. This subclass starts
+    empty and exposes load/release methods so extract_names can keep
+    peak memory to roughly one half.
+    """
+
+    def __init__(self) -> None:
+        # Deliberately skip NameDataset.__init__: it parses both halves
+        # eagerly. Halves are populated by load_first()/load_last().
+        self.first_names: Optional[dict] = None
+        self.last_names: Optional[dict] = None
+
+    def load_first(self) -> None:
+        """Materialize the first-names half if not already loaded."""
+        if self.first_names is None:
+            self.first_names = _load_half(FIRST_NAMES_CACHE, use_first_names=True)
+
+    def release_first(self) -> None:
+        """Drop the first-names half so its memory can be reclaimed."""
+        self.first_names = None
+        gc.collect()
+
+    def load_last(self) -> None:
+        """Materialize the last-names half if not already loaded."""
+        if self.last_names is None:
+            self.last_names = _load_half(LAST_NAMES_CACHE, use_first_names=False)
+
+    def release_last(self) -> None:
+        """Drop the last-names half so its memory can be reclaimed."""
+        self.last_names = None
+        gc.collect()
+
+    def get_country_codes(self, alpha_2: bool = False) -> list:
+        """
+        Return country codes derived from whichever halves are loaded.
+
+        The base implementation walks both name dicts unconditionally,
+        which would fail while one half is released.
+        """
+        countries = set()
+        for half in (self.first_names, self.last_names):
+            if half:
+                for entry in half.values():
+                    countries.update(entry['country'])
+        if alpha_2:
+            return sorted(countries)
+        return sorted(pycountry.countries.get(alpha_2=code).name
+                      for code in countries)
+
+
+class ArrowNameData:
+    """
+    Name data served from memory-mapped Arrow IPC files.
+
+    Drop-in replacement for LazyNameDataset covering the NameDataset API
+    this script uses (get_top_names, get_country_codes, load/release).
+    Each half is one table of (name, country, rank[, gender]) rows; the
+    file is mmap-ed, so "loading" maps pages lazily and the strings live
+    in a handful of Arrow buffers instead of per-name PyObject dicts.
+
+    Run convert_names_arrow.py once to produce the .arrow files.
+    """
+
+    def __init__(self) -> None:
+        self._first: Optional[pa.Table] = None
+        self._last: Optional[pa.Table] = None
+
+    @staticmethod
+    def available() -> bool:
+        """Whether both converted Arrow files exist."""
+        return FIRST_NAMES_ARROW.exists() and LAST_NAMES_ARROW.exists()
+
+    @staticmethod
+    def _open(path: Path) -> pa.Table:
+        return pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+
+    def load_first(self) -> None:
+        """Map the first-names table if not already mapped."""
+        if self._first is None:
+            self._first = self._open(FIRST_NAMES_ARROW)
+
+    def release_first(self) -> None:
+        """Drop the first-names mapping."""
+        self._first = None
+
+    def load_last(self) -> None:
+        """Map the last-names table if not already mapped."""
+        if self._last is None:
+            self._last = self._open(LAST_NAMES_ARROW)
+
+    def release_last(self) -> None:
+        """Drop the last-names mapping."""
+        self._last = None
+
+    def get_country_codes(self, alpha_2: bool = False) -> list:
+        """Return country codes present in whichever tables are mapped."""
+        countries = set()
+        for table in (self._first, self._last):
+            if table is not None:
+                column = table['country'].cast(pa.string())
+                countries.update(pc.unique(column).to_pylist())
+        if alpha_2:
+            return sorted(countries)
+        return sorted(pycountry.countries.get(alpha_2=code).name
+                      for code in countries)
+
+    def get_top_names(
+        self,
+        n: int = 100,
+        use_first_names: bool = True,
+        country_alpha2: Optional[str] = None,
+        gender: Optional[str] = None,
+    ) -> dict:
+        """
+        Return the top-n (lowest rank) names per country, shaped like
+        NameDataset.get_top_names: {country: {'M'/'F': [...]}} for first
+        names, {country: [...]} for last names.
+        """
+        table = self._first if use_first_names else self._last
+        if table is None:
+            raise ValueError('Requested name half is not loaded')
+
+        if country_alpha2 is not None:
+            mask = pc.equal(table['country'].cast(pa.string()), country_alpha2)
+            table = table.filter(mask)
+        if use_first_names and gender is not None:
+            mask = pc.equal(table['gender'].cast(pa.string()), gender[0])
+            table = table.filter(mask)
+
+        # Last-name ranks are dense per country, so rank <= n bounds the
+        # bucket and keeps the multi-million-row tail inside the mmap'd
+        # buffers instead of materializing it as Python objects below.
+        # First-name ranks are dense per country across both genders
+        # combined — the n-th name of one gender can carry a rank far
+        # above n — so for first names only the cap loop does the
+        # bounding.
+        if not use_first_names:
+            table = table.filter(pc.less_equal(table['rank'], n))
+
+        table = table.sort_by('rank')
+        names = table['name'].cast(pa.string()).to_pylist()
+        countries = table['country'].cast(pa.string()).to_pylist()
+        genders = (table['gender'].cast(pa.string()).to_pylist()
+                   if use_first_names else None)
+
+        result: dict = {}
+        counts: Dict[tuple, int] = {}
+        for i, name in enumerate(names):
+            country = countries[i]
+            bucket = genders[i] if genders is not None else ''
+            key = (country, bucket)
+            taken = counts.get(key, 0)
+            if taken >= n:
+                continue
+            counts[key] = taken + 1
+            if genders is not None:
+                result.setdefault(country, {}).setdefault(bucket, []).append(name)
+            else:
+                result.setdefault(country, []).append(name)
+        return result
+
+
+# Either backing store exposes the same load/release + lookup surface.
+NameSource = Union[LazyNameDataset, ArrowNameData]
+
+
+def initialize_dataset() -> NameSource:
+    """
+    Create a dataset handle, preferring the memory-mapped Arrow tables.
+
+    No name data is read until load_first()/load_last() is called, so
+    the caller controls which half is resident. A full eager load needs
+    ~3.2GB of RAM; loading one pickle half at a time roughly halves
+    that, and the Arrow-backed reader shrinks it further still.
+
+    Returns:
+        ArrowNameData when the converted files exist, else LazyNameDataset
     """
-    print("Loading name dataset (this may take a minute and ~3.2GB RAM)...")
-    return NameDataset()
+    if ArrowNameData.available():
+        print(f"Using memory-mapped Arrow name data ({CACHE_DIR})...")
+        return ArrowNameData()
+    return LazyNameDataset()
 
 
-def get_country_codes(nd: NameDataset) -> list:
+def get_country_codes(nd: NameSource) -> list:
     """
     Get all available country codes from the dataset.
     
@@ -57,217 +288,261 @@ def get_country_codes(nd: NameDataset) -> list:
     return nd.get_country_codes(alpha_2=True)
 
 
+def _lower_names(names: List[str]) -> List[str]:
+    """
+    Lowercase a batch of names with Arrow's vectorized utf8_lower.
+
+    One C++ pass over a contiguous buffer replaces a Python-level
+    str.lower() call (and its per-string allocation churn) for every
+    name in the batch. The results are interned: popular names recur
+    across many country batches, so interning collapses the duplicate
+    str objects to one allocation each and lets later dict/set probes
+    short-circuit on identity.
+
+    Args:
+        names: Names as returned by the dataset
+
+    Returns:
+        The same names, lowercased and interned
+    """
+    if not names:
+        return []
+    return [sys.intern(name) for name in pc.utf8_lower(pa.array(names)).to_pylist()]
+
+
 def extract_first_names(
-    nd: NameDataset,
-    country_codes: list,
+    nd: NameSource,
     top_n: int
-) -> Set[str]:
+) -> Dict[str, None]:
     """
     Extract the top N first names per country for both genders.
-    
+
+    A single get_top_names call with no country filter returns the
+    whole {country: {'M': [...], 'F': [...]}} map, so the dataset is
+    traversed once instead of once per country.
+
     Args:
         nd: Initialized NameDataset object
-        country_codes: List of country codes to process
         top_n: Number of top names to extract per country per gender
-        
+
     Returns:
-        Set of unique first names (title-cased as returned by the library)
+        Dict whose keys are the unique first names, lowercased to the
+        lexicon's canonical form (values are None; the dict is used as
+        an ordered set that build_lexicon can retag via dict.fromkeys)
     """
-    first_names: Set[str] = set()
-    
-    for country in country_codes:
-        # Extract male names
-        try:
-            male_names = nd.get_top_names(
-                n=top_n,
-                use_first_names=True,
-                country_alpha2=country,
-                gender='Male'
-            )
-            if country in male_names and 'M' in male_names[country]:
-                first_names.update(male_names[country]['M'])
-        except Exception as e:
-            print(f"  Warning: Could not get male names for {country}: {e}")
-        
-        # Extract female names
-        try:
-            female_names = nd.get_top_names(
-                n=top_n,
-                use_first_names=True,
-                country_alpha2=country,
-                gender='Female'
-            )
-            if country in female_names and 'F' in female_names[country]:
-                first_names.update(female_names[country]['F'])
-        except Exception as e:
-            print(f"  Warning: Could not get female names for {country}: {e}")
-    
+    first_names: Dict[str, None] = {}
+
+    all_names = nd.get_top_names(n=top_n, use_first_names=True)
+    for buckets in all_names.values():
+        first_names.update(dict.fromkeys(_lower_names(buckets.get('M', []))))
+        first_names.update(dict.fromkeys(_lower_names(buckets.get('F', []))))
+
     return first_names
 
 
-def extract_last_names(
-    nd: NameDataset,
-    country_codes: list,
+def extract_last_names_into(
+    lexicon: Dict[str, str],
+    nd: NameSource,
     top_n: int
-) -> Set[str]:
+) -> int:
     """
-    Extract the top N last names per country.
-    
+    Stream the top N last names per country directly into the lexicon.
+
+    As in extract_first_names, one unfiltered get_top_names call yields
+    every country's surnames at once. Each surname goes straight into
+    the (first-name-seeded) lexicon instead of an intermediate set that
+    would be discarded right after the merge. A surname already tagged
+    FirstName is left alone — compromise's pattern matching handles the
+    context-based disambiguation for such ambiguous names.
+
     Args:
+        lexicon: Lexicon already seeded with FirstName entries; LastName
+            entries are added in place
         nd: Initialized NameDataset object
-        country_codes: List of country codes to process
         top_n: Number of top names to extract per country
-        
+
     Returns:
-        Set of unique last names (title-cased as returned by the library)
+        Count of unique surnames skipped because they were already
+        known first names
     """
-    last_names: Set[str] = set()
-    
-    for country in country_codes:
-        try:
-            surnames = nd.get_top_names(
-                n=top_n,
-                use_first_names=False,
-                country_alpha2=country
-            )
-            if country in surnames:
-                last_names.update(surnames[country])
-        except Exception as e:
-            print(f"  Warning: Could not get last names for {country}: {e}")
-    
-    return last_names
+    # Only the (small) overlap is retained, so the ambiguous count stays
+    # exact without keeping every surname around.
+    ambiguous: set = set()
+
+    all_surnames = nd.get_top_names(n=top_n, use_first_names=False)
+    for surnames in all_surnames.values():
+        for name in _lower_names(surnames):
+            tag = lexicon.get(name)
+            if tag is None:
+                lexicon[name] = 'LastName'
+            elif tag == 'FirstName':
+                ambiguous.add(name)
 
+    return len(ambiguous)
 
-def build_lexicon(
-    first_names: Set[str],
-    last_names: Set[str]
-) -> Dict[str, str]:
+
+def build_lexicon(first_names: Dict[str, None]) -> Dict[str, str]:
     """
-    Build a compromise-compatible lexicon from the extracted names.
-    
+    Seed a compromise-compatible lexicon from the extracted first names.
+
     Compromise uses lowercase keys in its lexicon. Names are tagged as:
     - 'FirstName': Given names
     - 'LastName': Family names
-    
-    When a name appears in both sets (e.g., "Jordan"), it's kept as FirstName
-    since compromise's pattern matching can handle context-based disambiguation.
-    
+
+    Only the FirstName half is materialized here; last names are
+    streamed into the returned dict by extract_last_names_into, which
+    gives first names priority for ambiguous entries.
+
     Args:
-        first_names: Set of first names
-        last_names: Set of last names
-        
+        first_names: Lowercased first names (keys of the accumulator dict)
+
     Returns:
-        Dictionary mapping lowercase names to their compromise tags
+        Dictionary mapping lowercase first names to 'FirstName'
     """
-    lexicon: Dict[str, str] = {}
-    
-    # Add first names (these take priority for ambiguous names)
-    for name in first_names:
-        key = name.lower()
-        lexicon[key] = 'FirstName'
-    
-    # Add last names (skip if already a first name)
-    for name in last_names:
-        key = name.lower()
-        if key not in lexicon:
-            lexicon[key] = 'LastName'
-    
-    return lexicon
+    return dict.fromkeys(first_names, 'FirstName')
+
+
+# Shared banner for all generated module files.
+GENERATED_HEADER = (
+    b"// Auto-generated name lexicon for compromise NLP\n"
+    b"// Source: https://github.com/philipperemy/name-dataset\n"
+    b"// Do not edit manually - regenerate using extract_names.py\n\n"
+)
+
+
+def _write_json_body(f, lexicon: Dict[str, str]) -> None:
+    """
+    Stream the lexicon as pretty-printed JSON, one entry per line.
+
+    Entries are written directly to the (buffered) stream instead of
+    serializing the whole dict to one in-memory blob first, so peak
+    memory for the output stage is bounded by the write buffer rather
+    than the lexicon size. Keys are JSON-escaped via orjson; values are
+    the fixed compromise tags and need no escaping.
+
+    Args:
+        f: Binary output stream
+        lexicon: The name lexicon dictionary
+    """
+    f.write(b'{')
+    separator = b'\n  '
+    for key, tag in lexicon.items():
+        f.write(separator)
+        f.write(orjson.dumps(key))
+        f.write(b': "')
+        f.write(tag.encode('ascii'))
+        f.write(b'"')
+        separator = b',\n  '
+    f.write(b'\n}' if lexicon else b'}')
 
 
 def generate_json_output(lexicon: Dict[str, str], output_path: Path) -> None:
     """
-    Generate a JSON file containing the lexicon.
-    
+    Generate the canonical JSON file containing the lexicon.
+
+    This is the only file that carries the name data; the TypeScript,
+    ESM, and CJS outputs are thin wrappers that load it at import time.
+
     Args:
         lexicon: The name lexicon dictionary
         output_path: Directory to save the output file
     """
     json_file = output_path / "names-lexicon.json"
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(lexicon, f, ensure_ascii=False, indent=2)
+    with open(json_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        _write_json_body(f, lexicon)
     print(f"  Saved JSON lexicon to {json_file}")
 
 
-def generate_typescript_output(lexicon: Dict[str, str], output_path: Path) -> None:
+def generate_typescript_output(output_path: Path) -> None:
     """
-    Generate a TypeScript module containing the lexicon.
-    
+    Generate a TypeScript wrapper module re-exporting the JSON lexicon.
+
+    Requires "resolveJsonModule" in the consuming tsconfig.
+
     Args:
-        lexicon: The name lexicon dictionary
         output_path: Directory to save the output file
     """
     ts_file = output_path / "names-lexicon.ts"
-    with open(ts_file, 'w', encoding='utf-8') as f:
-        f.write("// Auto-generated name lexicon for compromise NLP\n")
-        f.write("// Source: https://github.com/philipperemy/name-dataset\n")
-        f.write("// Do not edit manually - regenerate using extract_names.py\n\n")
-        f.write("export const nameLexicon: Record<string, string> = ")
-        json.dump(lexicon, f, ensure_ascii=False, indent=2)
-        f.write(";\n")
+    with open(ts_file, 'wb') as f:
+        f.write(GENERATED_HEADER)
+        f.write(b"import data from './names-lexicon.json';\n\n")
+        f.write(b"export const nameLexicon: Record<string, string> = data;\n")
     print(f"  Saved TypeScript module to {ts_file}")
 
 
-def generate_esm_output(lexicon: Dict[str, str], output_path: Path) -> None:
+def generate_esm_output(output_path: Path) -> None:
     """
-    Generate an ESM (ECMAScript Module) JavaScript file containing the lexicon.
-    
+    Generate an ESM wrapper module re-exporting the JSON lexicon.
+
+    Uses a `with { type: 'json' }` import attribute, which requires a
+    runtime supporting import attributes (Node 20.10+; the older
+    `assert` form was removed from V8/Node).
+
     Args:
-        lexicon: The name lexicon dictionary
         output_path: Directory to save the output file
     """
     mjs_file = output_path / "names-lexicon.mjs"
-    with open(mjs_file, 'w', encoding='utf-8') as f:
-        f.write("// Auto-generated name lexicon for compromise NLP\n")
-        f.write("// Source: https://github.com/philipperemy/name-dataset\n")
-        f.write("// Do not edit manually - regenerate using extract_names.py\n\n")
-        f.write("export const nameLexicon = ")
-        json.dump(lexicon, f, ensure_ascii=False, indent=2)
-        f.write(";\n")
+    with open(mjs_file, 'wb') as f:
+        f.write(GENERATED_HEADER)
+        f.write(b"export { default as nameLexicon } from "
+                b"'./names-lexicon.json' with { type: 'json' };\n")
     print(f"  Saved ESM module to {mjs_file}")
 
 
-def generate_cjs_output(lexicon: Dict[str, str], output_path: Path) -> None:
+def generate_cjs_output(output_path: Path) -> None:
     """
-    Generate a CommonJS module containing the lexicon.
-    
+    Generate a CommonJS wrapper module re-exporting the JSON lexicon.
+
     Args:
-        lexicon: The name lexicon dictionary
         output_path: Directory to save the output file
     """
     cjs_file = output_path / "names-lexicon.cjs"
-    with open(cjs_file, 'w', encoding='utf-8') as f:
-        f.write("// Auto-generated name lexicon for compromise NLP\n")
-        f.write("// Source: https://github.com/philipperemy/name-dataset\n")
-        f.write("// Do not edit manually - regenerate using extract_names.py\n\n")
-        f.write("const nameLexicon = ")
-        json.dump(lexicon, f, ensure_ascii=False, indent=2)
-        f.write(";\n\n")
-        f.write("module.exports = { nameLexicon };\n")
+    with open(cjs_file, 'wb') as f:
+        f.write(GENERATED_HEADER)
+        f.write(b"module.exports = { nameLexicon: "
+                b"require('./names-lexicon.json') };\n")
     print(f"  Saved CommonJS module to {cjs_file}")
 
 
+async def write_outputs(lexicon: Dict[str, str], output_path: Path) -> None:
+    """
+    Write all four output files concurrently.
+
+    Each generator does blocking file I/O, so they are dispatched to
+    worker threads and gathered; on drives with parallel I/O queues the
+    flushes overlap instead of running back to back.
+
+    Args:
+        lexicon: The name lexicon dictionary
+        output_path: Directory to save the output files
+    """
+    await asyncio.gather(
+        asyncio.to_thread(generate_json_output, lexicon, output_path),
+        asyncio.to_thread(generate_typescript_output, output_path),
+        asyncio.to_thread(generate_esm_output, output_path),
+        asyncio.to_thread(generate_cjs_output, output_path),
+    )
+
+
 def print_statistics(
-    first_names: Set[str],
-    last_names: Set[str],
     lexicon: Dict[str, str],
+    ambiguous_count: int,
     country_count: int,
     top_n: int
 ) -> None:
     """
     Print summary statistics about the extraction.
-    
+
     Args:
-        first_names: Set of extracted first names
-        last_names: Set of extracted last names
         lexicon: The final lexicon dictionary
+        ambiguous_count: Surnames skipped for already being first names
         country_count: Number of countries processed
         top_n: Top N parameter used
     """
-    first_count = sum(1 for v in lexicon.values() if v == 'FirstName')
-    last_count = sum(1 for v in lexicon.values() if v == 'LastName')
-    ambiguous_count = len(first_names & last_names)
-    
+    tag_counts = Counter(lexicon.values())
+    first_count = tag_counts['FirstName']
+    last_count = tag_counts['LastName']
+
     print("\n" + "=" * 50)
     print("EXTRACTION SUMMARY")
     print("=" * 50)
@@ -275,8 +550,10 @@ def print_statistics(
     print(f"  - Countries processed: {country_count}")
     print(f"  - Top N per country: {top_n}")
     print(f"\nExtracted names:")
-    print(f"  - Unique first names: {len(first_names):,}")
-    print(f"  - Unique last names: {len(last_names):,}")
+    print(f"  - Unique first names: {first_count:,}")
+    # Ambiguous surnames never get the LastName tag, so they are added
+    # back to keep this an extraction count rather than a tag count
+    print(f"  - Unique last names: {last_count + ambiguous_count:,}")
     print(f"  - Ambiguous (both): {ambiguous_count:,}")
     print(f"\nFinal lexicon:")
     print(f"  - Total entries: {len(lexicon):,}")
@@ -296,41 +573,51 @@ def extract_names(top_n: int, output_dir: str) -> Dict[str, str]:
     Returns:
         The generated lexicon dictionary
     """
-    # Initialize dataset
+    # Initialize dataset handle; halves are loaded one at a time below
+    # to keep peak memory to roughly half of a full eager load
     nd = initialize_dataset()
-    
-    # Get country codes
+
+    # Extract first names
+    print("Loading first names...")
+    nd.load_first()
+
     country_codes = get_country_codes(nd)
     print(f"Processing {len(country_codes)} countries...")
-    
-    # Extract first names
+
     print("\nExtracting first names...")
-    first_names = extract_first_names(nd, country_codes, top_n)
+    first_names = extract_first_names(nd, top_n)
     print(f"  Found {len(first_names):,} unique first names")
-    
-    # Extract last names
-    print("\nExtracting last names...")
-    last_names = extract_last_names(nd, country_codes, top_n)
-    print(f"  Found {len(last_names):,} unique last names")
-    
-    # Build lexicon
+    nd.release_first()
+
+    # Seed the lexicon before the surname phase so last names stream
+    # straight into it; the first-name accumulator is no longer needed
     print("\nBuilding lexicon...")
-    lexicon = build_lexicon(first_names, last_names)
-    print(f"  Created lexicon with {len(lexicon):,} entries")
-    
+    lexicon = build_lexicon(first_names)
+    first_count = len(lexicon)
+    del first_names
+
+    # Extract last names directly into the lexicon
+    print("\nLoading last names...")
+    nd.load_last()
+
+    print("\nExtracting last names...")
+    ambiguous_count = extract_last_names_into(lexicon, nd, top_n)
+    last_count = len(lexicon) - first_count + ambiguous_count
+    print(f"  Found {last_count:,} unique last names")
+    nd.release_last()
+    print(f"  Lexicon now has {len(lexicon):,} entries")
+
     # Create output directory
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    # Generate output files
+    # Generate output files concurrently: the JSON carries the data,
+    # the module wrappers just re-export it
     print("\nGenerating output files...")
-    generate_json_output(lexicon, output_path)
-    generate_typescript_output(lexicon, output_path)
-    generate_esm_output(lexicon, output_path)
-    generate_cjs_output(lexicon, output_path)
+    asyncio.run(write_outputs(lexicon, output_path))
     
     # Print statistics
-    print_statistics(first_names, last_names, lexicon, len(country_codes), top_n)
+    print_statistics(lexicon, ambiguous_count, len(country_codes), top_n)
     
     return lexicon
 
@@ -347,7 +634,7 @@ Examples:
   python scripts/extract_names.py --top-n 500 --output output
   python scripts/extract_names.py -n 1000 -o ./lexicon
 
-Note: The name-dataset library requires ~3.2GB RAM to load.
+Note: Name data is loaded one half at a time (~1.6GB RAM peak).
         """
     )
     parser.add_argument(